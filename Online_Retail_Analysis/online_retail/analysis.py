@@ -1,20 +1,82 @@
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
-from functools import reduce
-from typing import Dict, Iterable, Iterator, List, Tuple
+from operator import itemgetter
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple, TypeVar
 
 from .models import Transaction
 
+K = TypeVar("K", bound=Hashable)
+
 
 # --------- Stream filters --------- #
 
+def _is_valid(t: Transaction) -> bool:
+    return not t.is_cancellation and t.quantity > 0 and t.unit_price > 0
+
+
 def valid_transactions(records: Iterable[Transaction]) -> Iterator[Transaction]:
-    return (
-        t
-        for t in records
-        if not t.is_cancellation and t.quantity > 0 and t.unit_price > 0
-    )
+    return (t for t in records if _is_valid(t))
+
+
+def partition_transactions(
+    records: Iterable[Transaction],
+) -> Tuple[List[Transaction], List[Transaction]]:
+    """
+    Split a stream into (valid, rejected) lists in a single pass.
+
+    Lets callers consume a one-shot stream once while still keeping the
+    rejected rows (cancellations etc.) around for raw-level metrics,
+    without holding a second copy of the full input.
+    """
+    valid: List[Transaction] = []
+    rejected: List[Transaction] = []
+    for t in records:
+        (valid if _is_valid(t) else rejected).append(t)
+    return valid, rejected
+
+
+# --------- Helpers --------- #
+
+class _Sum:
+    """
+    Streaming compensated (Neumaier) sum.
+
+    Every revenue amount in this module is accumulated through it, so
+    grand totals, per-group totals and ratios all use one summation
+    policy: no drift from naive float addition, in O(1) memory per sum.
+    """
+
+    __slots__ = ("_total", "_comp")
+
+    def __init__(self) -> None:
+        self._total = 0.0
+        self._comp = 0.0
+
+    def add(self, x: float) -> None:
+        total = self._total
+        s = total + x
+        # Recover the low-order bits lost by the addition above
+        if abs(total) >= abs(x):
+            self._comp += (total - s) + x
+        else:
+            self._comp += (x - s) + total
+        self._total = s
+
+    def __float__(self) -> float:
+        return self._total + self._comp
+
+
+def _rounded(totals: Dict[K, _Sum]) -> Dict[K, float]:
+    return {k: round(float(amount), 2) for k, amount in totals.items()}
+
+
+def _top_n(totals: Dict[str, _Sum], n: int) -> List[Tuple[str, float]]:
+    # O(N log n) partial selection; same ordering as sorted(...)[:n]
+    amounts = ((k, float(amount)) for k, amount in totals.items())
+    top = heapq.nlargest(n, amounts, key=itemgetter(1))
+    return [(k, round(amount, 2)) for k, amount in top]
 
 
 # --------- Aggregations --------- #
@@ -22,30 +84,36 @@ def valid_transactions(records: Iterable[Transaction]) -> Iterator[Transaction]:
 def total_revenue(records: Iterable[Transaction]) -> float:
     """
     Total revenue across all valid line items.
-    Uses a generator expression to stay streamed.
     """
-    return round(sum(t.line_total for t in records), 2)
+    total = _Sum()
+    for t in records:
+        total.add(t.line_total)
+    return round(float(total), 2)
 
 
 def revenue_by_country(records: Iterable[Transaction]) -> Dict[str, float]:
     """
     Aggregate revenue per country.
     """
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, _Sum] = defaultdict(_Sum)
     for t in records:
-        totals[t.country] += t.line_total
-    return {country: round(amount, 2) for country, amount in totals.items()}
+        totals[t.country].add(t.line_total)
+    return _rounded(totals)
 
 
 def monthly_revenue(records: Iterable[Transaction]) -> Dict[str, float]:
     """
     Aggregate revenue per calendar month (YYYY-MM).
     """
-    totals: Dict[str, float] = defaultdict(float)
+    # Group on (year, month) tuples; the label is formatted once per month
+    totals: Dict[Tuple[int, int], _Sum] = defaultdict(_Sum)
     for t in records:
-        key = f"{t.invoice_date.year}-{t.invoice_date.month:02d}"
-        totals[key] += t.line_total
-    return {month: round(amount, 2) for month, amount in totals.items()}
+        d = t.invoice_date
+        totals[(d.year, d.month)].add(t.line_total)
+    return {
+        f"{year}-{month:02d}": round(float(amount), 2)
+        for (year, month), amount in totals.items()
+    }
 
 
 def top_n_products_by_revenue(
@@ -55,17 +123,11 @@ def top_n_products_by_revenue(
     """
     Top N products by revenue, using Description as the product name.
     """
-    per_product: Dict[str, float] = defaultdict(float)
+    per_product: Dict[str, _Sum] = defaultdict(_Sum)
     for t in records:
         key = t.description or t.stock_code
-        per_product[key] += t.line_total
-
-    sorted_items = sorted(
-        per_product.items(),
-        key=lambda item: item[1],  # lambda for sort key
-        reverse=True,
-    )
-    return [(name, round(amount, 2)) for name, amount in sorted_items[:n]]
+        per_product[key].add(t.line_total)
+    return _top_n(per_product, n)
 
 
 def top_n_customers_by_revenue(
@@ -76,42 +138,32 @@ def top_n_customers_by_revenue(
     Top N customers by revenue.
     Rows with missing CustomerID are ignored.
     """
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, _Sum] = defaultdict(_Sum)
     for t in records:
         if t.customer_id is None:
             continue
-        totals[t.customer_id] += t.line_total
-
-    sorted_items = sorted(
-        totals.items(),
-        key=lambda item: item[1],
-        reverse=True,
-    )
-    return [(cust, round(amount, 2)) for cust, amount in sorted_items[:n]]
+        totals[t.customer_id].add(t.line_total)
+    return _top_n(totals, n)
 
 
 def avg_order_value(records: Iterable[Transaction]) -> float:
     """
     Average revenue per invoice (InvoiceNo).
 
-    Uses functional style: reduce + small inner function instead
-    of mutating a dict in-place.
+    Invoice totals are accumulated in place: one dict update per row,
+    linear in the number of records.
     """
-
-    def reducer(acc: Dict[str, float], t: Transaction) -> Dict[str, float]:
-        total = acc.get(t.invoice_no, 0.0) + t.line_total
-        return acc | {t.invoice_no: total}
-
-    invoice_totals: Dict[str, float] = reduce(
-        reducer,
-        records,
-        {},
-    )
+    invoice_totals: Dict[str, _Sum] = defaultdict(_Sum)
+    for t in records:
+        invoice_totals[t.invoice_no].add(t.line_total)
 
     if not invoice_totals:
         return 0.0
 
-    return round(sum(invoice_totals.values()) / len(invoice_totals), 2)
+    grand_total = _Sum()
+    for amount in invoice_totals.values():
+        grand_total.add(float(amount))
+    return round(float(grand_total) / len(invoice_totals), 2)
 
 
 def units_sold_per_product(records: Iterable[Transaction]) -> Dict[str, int]:
@@ -132,14 +184,17 @@ def cancellation_rate(records: Iterable[Transaction]) -> float:
     This function demonstrates that we can also look at the
     *raw* records (including cancellations) when needed.
     """
-    total = 0.0
-    cancelled = 0.0
+    total = _Sum()
+    cancelled = _Sum()
 
     for t in records:
-        total += abs(t.line_total)
+        amount = abs(t.line_total)
+        total.add(amount)
         if t.is_cancellation:
-            cancelled += abs(t.line_total)
+            cancelled.add(amount)
 
-    if total == 0:
+    gross = float(total)
+    if gross == 0:
         return 0.0
-    return round(100.0 * cancelled / total, 2)
\ No newline at end of file
+    return round(100.0 * float(cancelled) / gross, 2)
+
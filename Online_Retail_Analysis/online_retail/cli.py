@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from itertools import chain
 from pathlib import Path
 from typing import List
 
@@ -8,12 +9,12 @@ from .analysis import (
     avg_order_value,
     cancellation_rate,
     monthly_revenue,
+    partition_transactions,
     revenue_by_country,
     top_n_customers_by_revenue,
     top_n_products_by_revenue,
     total_revenue,
     units_sold_per_product,
-    valid_transactions,
 )
 from .io_utils import load_transactions
 from .models import Transaction
@@ -65,16 +66,14 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    raw_iter = load_transactions(args.csv)
-
-    # Apply streaming filter and then materialize once to reuse
-    valid_list: List[Transaction] = list(valid_transactions(raw_iter))
+    # Parse the CSV exactly once. Every loaded record stays in memory until
+    # exit: the valid rows for the analyses, plus the rejected rows, which
+    # are kept only to feed cancellation_rate.
+    valid_list, rejected_list = partition_transactions(load_transactions(args.csv))
     run_analyses(valid_list)
 
-
-    raw_again = load_transactions(args.csv)
     print("\nCancellation rate (percentage of cancelled revenue over gross):")
-    print(f"  {cancellation_rate(raw_again):.2f}%")
+    print(f"  {cancellation_rate(chain(valid_list, rejected_list)):.2f}%")
 
 
 
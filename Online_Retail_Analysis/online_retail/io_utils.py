@@ -1,16 +1,62 @@
 from __future__ import annotations
 
 import csv
+from sys import intern
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterator, Optional
 
 from .models import Transaction
 
+# UCI columns every row must have, in the order they are unpacked below
+_REQUIRED_COLUMNS = (
+    "InvoiceNo",
+    "StockCode",
+    "Quantity",
+    "InvoiceDate",
+    "UnitPrice",
+    "Country",
+)
 
+_READ_BUFFER = 1 << 20
+
+
+def _digits(part: str, max_len: int, raw: str) -> int:
+    # Plain ASCII digits only, like strptime: int() alone would also
+    # accept "+1", "1_2", non-ASCII digits and over-long "012".
+    if not (0 < len(part) <= max_len and part.isascii() and part.isdigit()):
+        raise ValueError(f"invalid InvoiceDate: {raw!r}")
+    return int(part)
+
+
+@lru_cache(maxsize=4096)
 def _parse_invoice_date(raw: str) -> datetime:
-    return datetime.strptime(raw.strip(), "%m/%d/%y %H:%M")
+    """
+    Parse an InvoiceDate such as "12/1/10 08:26" ("%m/%d/%y %H:%M").
 
+    Hand-rolled instead of datetime.strptime, and cached because every
+    line item of an invoice repeats the same timestamp. Accepts and
+    rejects the same inputs as strptime with that format, raising
+    ValueError on malformed input.
+    """
+    # strptime matches the format's space against any whitespace run
+    date_part, time_part = raw.split()
+    month, day, year = date_part.split("/")
+    hour, minute = time_part.split(":")
+    if len(year) != 2:
+        raise ValueError(f"invalid InvoiceDate: {raw!r}")
+    yy = _digits(year, 2, raw)
+    # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+    yy += 1900 if yy >= 69 else 2000
+    return datetime(
+        yy,
+        _digits(month, 2, raw),
+        _digits(day, 2, raw),
+        _digits(hour, 2, raw),
+        _digits(minute, 2, raw),
+    )
 
 
 def _opt_str(val: str | None) -> Optional[str]:
@@ -20,6 +66,11 @@ def _opt_str(val: str | None) -> Optional[str]:
     return v or None
 
 
+def _opt_intern(val: str | None) -> Optional[str]:
+    v = _opt_str(val)
+    return None if v is None else intern(v)
+
+
 def load_transactions(csv_path: str | Path) -> Iterator[Transaction]:
     """
     Lazily load Transaction objects from an Online Retail CSV file.
@@ -30,30 +81,53 @@ def load_transactions(csv_path: str | Path) -> Iterator[Transaction]:
     """
     path = Path(csv_path)
 
-    # Many copies of this dataset need ISO-8859-1 to read descriptions cleanly
-    with path.open(newline="", encoding="ISO-8859-1") as f:
-        reader = csv.DictReader(f)
+    # Many copies of this dataset need ISO-8859-1 to read descriptions cleanly.
+    # A 1 MiB read buffer keeps the number of read syscalls low on large files.
+    with path.open(newline="", encoding="ISO-8859-1", buffering=_READ_BUFFER) as f:
+        # Plain csv.reader + positional indexes: no per-row dict allocation
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        col = {name.strip(): i for i, name in enumerate(header)}
+        # One C-level call pulls the required fields out of a row
+        pick = itemgetter(*(col[name] for name in _REQUIRED_COLUMNS))
+        # Description and CustomerID are optional: a missing column
+        # yields None for every row
+        i_desc = col.get("Description")
+        i_cust = col.get("CustomerID")
+        width = len(header)
+
         for row in reader:
+            if len(row) < width:
+                # Truncated line: skip, like rows with invalid numerics
+                continue
+
+            invoice_no, stock_code, qty, date, price, country = pick(row)
+            description = None if i_desc is None else row[i_desc]
+            customer_id = None if i_cust is None else row[i_cust]
             try:
-                quantity = int(row["Quantity"])
-                unit_price = float(row["UnitPrice"])
-            except (KeyError, TypeError, ValueError):
+                quantity = int(qty)
+                unit_price = float(price)
+            except ValueError:
                 # Skip rows with invalid numerics
                 continue
 
-            
             try:
-                invoice_date = _parse_invoice_date(row["InvoiceDate"])
-            except ValueError as e:
+                invoice_date = _parse_invoice_date(date)
+            except ValueError:
                 continue
 
+            # Positional args in Transaction field order (cheaper than kwargs).
+            # Repeating key columns are interned: one shared str per distinct
+            # value, so group-by lookups hit dict's identity fast path.
             yield Transaction(
-                invoice_no=row["InvoiceNo"].strip(),
-                stock_code=row["StockCode"].strip(),
-                description=_opt_str(row.get("Description")),
-                quantity=quantity,
-                invoice_date=invoice_date ,
-                unit_price=unit_price,
-                customer_id=_opt_str(row.get("CustomerID")),
-                country=row["Country"].strip(),
-            )
\ No newline at end of file
+                intern(invoice_no.strip()),
+                intern(stock_code.strip()),
+                _opt_intern(description),
+                quantity,
+                invoice_date,
+                unit_price,
+                _opt_intern(customer_id),
+                intern(country.strip()),
+            )
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     Represents one line item in the Online Retail dataset.
@@ -13,6 +13,9 @@ class Transaction:
     Fields mirror UCI schema:
     - InvoiceNo, StockCode, Description, Quantity,
       InvoiceDate, UnitPrice, CustomerID, Country
+
+    line_total and is_cancellation are derived once at construction,
+    so the aggregation loops read them as plain slot attributes.
     """
     invoice_no: str
     stock_code: str
@@ -22,15 +25,13 @@ class Transaction:
     unit_price: float
     customer_id: Optional[str]
     country: str
+    # Derived from the fields above, so kept out of repr() and ==.
+    # Total value for this line item.
+    line_total: float = field(init=False, repr=False, compare=False)
+    # UCI notes: invoice numbers starting with 'C' are cancellations.
+    is_cancellation: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def line_total(self) -> float:
-        """Total value for this line item."""
-        return self.quantity * self.unit_price
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "line_total", self.quantity * self.unit_price)
+        object.__setattr__(self, "is_cancellation", self.invoice_no.startswith("C"))
 
-    @property
-    def is_cancellation(self) -> bool:
-        """
-        UCI notes: invoice numbers starting with 'C' are cancellations.
-        """
-        return self.invoice_no.startswith("C")
\ No newline at end of file
@@ -1,4 +1,6 @@
+import math
 import unittest
+from dataclasses import replace
 from datetime import datetime
 
 from online_retail.models import Transaction
@@ -6,6 +8,7 @@ from online_retail.analysis import (
     avg_order_value,
     cancellation_rate,
     monthly_revenue,
+    partition_transactions,
     revenue_by_country,
     top_n_customers_by_revenue,
     top_n_products_by_revenue,
@@ -66,6 +69,24 @@ class AnalysisTests(unittest.TestCase):
         self.records = list(valid_transactions(self.raw))
 
 
+    # -------- Transaction -------- #
+    def test_transaction_derived_fields(self) -> None:
+        cancelled = self.raw[2]
+        self.assertAlmostEqual(cancelled.line_total, -15.30)
+        self.assertTrue(cancelled.is_cancellation)
+        self.assertFalse(self.raw[0].is_cancellation)
+        # slots=True: no per-instance __dict__
+        self.assertFalse(hasattr(cancelled, "__dict__"))
+
+    def test_transaction_derived_fields_not_in_repr_or_eq(self) -> None:
+        text = repr(self.raw[0])
+        self.assertNotIn("line_total", text)
+        self.assertNotIn("is_cancellation", text)
+        # Equality and hashing still cover only the UCI columns
+        self.assertEqual(self.raw[0], replace(self.raw[0]))
+        self.assertEqual(hash(self.raw[0]), hash(replace(self.raw[0])))
+
+
     # -------- valid_transactions -------- #
     def test_valid_transactions_filters_cancellations(self) -> None:
         # We started with 4 rows, 1 is a cancellation
@@ -131,6 +152,16 @@ class AnalysisTests(unittest.TestCase):
         self.assertEqual(len(filtered), 0)
 
 
+    # -------- partition_transactions -------- #
+    def test_partition_transactions_splits_in_one_pass(self) -> None:
+        valid, rejected = partition_transactions(iter(self.raw))
+        self.assertEqual(valid, self.records)
+        self.assertEqual([t.invoice_no for t in rejected], ["C536379"])
+
+    def test_partition_transactions_empty(self) -> None:
+        self.assertEqual(partition_transactions([]), ([], []))
+
+
     # -------- total_revenue -------- #
     def test_total_revenue(self) -> None:
         # 1st: 6 * 2.55 = 15.30
@@ -141,6 +172,19 @@ class AnalysisTests(unittest.TestCase):
     def test_total_revenue_empty(self) -> None:
         self.assertEqual(total_revenue([]), 0.0)
 
+    def test_revenue_sums_are_compensated(self) -> None:
+        prices = [0.05, 0.05, 0.05, 0.005]
+        # Naive float addition lands on the wrong side of the half cent
+        self.assertEqual(round(sum(prices), 2), 0.16)
+        self.assertEqual(round(math.fsum(prices), 2), 0.15)
+
+        records = [
+            replace(self.raw[0], quantity=1, unit_price=price) for price in prices
+        ]
+        self.assertEqual(total_revenue(records), 0.15)
+        self.assertEqual(revenue_by_country(records), {"United Kingdom": 0.15})
+        self.assertEqual(avg_order_value(records), 0.15)
+
     # -------- revenue_by_country -------- #
     def test_revenue_by_country(self) -> None:
         result = revenue_by_country(self.records)
@@ -0,0 +1,119 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from online_retail.io_utils import _parse_invoice_date, load_transactions
+
+
+CSV_TEXT = (
+    "InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,Country\n"
+    "536365,85123A,WHITE HANGING HEART T-LIGHT HOLDER,6,12/1/10 08:26,2.55,17850,United Kingdom\n"
+    "536365,71053,WHITE METAL LANTERN,6,12/1/10 08:26,3.39,17850,United Kingdom\n"
+    "C536379,D,Discount,-1,12/1/10 09:41,27.5,,United Kingdom\n"
+    # Invalid numerics, invalid date and a truncated line are skipped
+    "536380,X1,Bad quantity,abc,12/1/10 09:41,1.0,17850,France\n"
+    "536381,X2,Bad date,1,not a date,1.0,17850,France\n"
+    "536382,X3\n"
+)
+
+
+class ParseInvoiceDateTests(unittest.TestCase):
+    def test_matches_strptime(self) -> None:
+        cases = [
+            # well-formed, including unpadded fields and odd whitespace
+            "12/1/10 08:26",
+            "1/9/11 8:5",
+            " 12/1/10 08:26 ",
+            "12/1/10  08:26",
+            "12/1/10\t08:26",
+            # %y pivot: 68 -> 2068, 69 -> 1969
+            "12/1/68 08:26",
+            "12/1/69 08:26",
+            # malformed
+            "+1/1/10 8:26",
+            "012/1/10 8:26",
+            "1_2/1/10 8:26",
+            "\u0661\u0662/1/10 08:26",
+            "12/1/2010 08:26",
+            "12/1/1 08:26",
+            "12/1/10 008:26",
+            "12/1/10 8:026",
+            "12/1/10 08:26:00",
+            "12/1/10 8:",
+            "12 /1/10 08:26",
+            "0/1/10 08:26",
+            "2/30/10 08:26",
+            "12/1/10 24:00",
+            "12/1/10 23:60",
+            "12/1/10",
+            "",
+        ]
+        for raw in cases:
+            with self.subTest(raw=raw):
+                try:
+                    expected = datetime.strptime(raw.strip(), "%m/%d/%y %H:%M")
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        _parse_invoice_date(raw)
+                else:
+                    self.assertEqual(_parse_invoice_date(raw), expected)
+
+
+class LoadTransactionsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="ISO-8859-1"
+        )
+        with tmp:
+            tmp.write(CSV_TEXT)
+        self.path = Path(tmp.name)
+        self.addCleanup(self.path.unlink)
+
+    def test_load_transactions_parses_rows(self) -> None:
+        records = list(load_transactions(self.path))
+        self.assertEqual(len(records), 3)
+
+        first = records[0]
+        self.assertEqual(first.invoice_no, "536365")
+        self.assertEqual(first.quantity, 6)
+        self.assertEqual(first.invoice_date, datetime(2010, 12, 1, 8, 26))
+        self.assertEqual(first.customer_id, "17850")
+
+        # Empty CustomerID becomes None
+        self.assertIsNone(records[2].customer_id)
+        self.assertTrue(records[2].is_cancellation)
+
+    def test_load_transactions_interns_key_columns(self) -> None:
+        first, second, _ = load_transactions(self.path)
+        self.assertIs(first.country, second.country)
+        self.assertIs(first.invoice_no, second.invoice_no)
+
+    def test_load_transactions_optional_columns_missing(self) -> None:
+        self.path.write_text(
+            "InvoiceNo,StockCode,Quantity,InvoiceDate,UnitPrice,Country\n"
+            "536365,85123A,6,12/1/10 08:26,2.55,United Kingdom\n",
+            encoding="ISO-8859-1",
+        )
+        (record,) = load_transactions(self.path)
+        self.assertIsNone(record.description)
+        self.assertIsNone(record.customer_id)
+        self.assertEqual(record.stock_code, "85123A")
+        self.assertAlmostEqual(record.line_total, 15.30)
+
+    def test_load_transactions_required_column_missing(self) -> None:
+        self.path.write_text(
+            "InvoiceNo,StockCode,Quantity,InvoiceDate,Country\n"
+            "536365,85123A,6,12/1/10 08:26,United Kingdom\n",
+            encoding="ISO-8859-1",
+        )
+        with self.assertRaises(KeyError):
+            list(load_transactions(self.path))
+
+    def test_load_transactions_empty_file(self) -> None:
+        self.path.write_text("", encoding="ISO-8859-1")
+        self.assertEqual(list(load_transactions(self.path)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
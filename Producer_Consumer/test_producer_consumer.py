@@ -26,6 +26,35 @@ class TestBoundedBlockingQueue(unittest.TestCase):
         self.assertEqual(q.get(), 3)
         self.assertTrue(q.empty())
 
+    def test_put_many_blocks_until_consumer_frees_space(self) -> None:
+        q: BoundedBlockingQueue[int] = BoundedBlockingQueue(maxsize=3)
+        produced: List[int] = list(range(5))
+
+        from threading import Thread
+
+        t_producer = Thread(target=q.put_many, args=(produced,))
+        t_producer.start()
+
+        # Only 3 of the 5 items fit, so put_many must still be blocked
+        time.sleep(0.1)
+        self.assertTrue(t_producer.is_alive())
+        self.assertTrue(q.full())
+
+        consumed = [q.get() for _ in produced]
+        t_producer.join(timeout=3)
+
+        self.assertFalse(t_producer.is_alive())
+        self.assertEqual(consumed, produced)
+        self.assertTrue(q.empty())
+
+    def test_get_many_returns_available_items_up_to_limit(self) -> None:
+        q: BoundedBlockingQueue[int] = BoundedBlockingQueue(maxsize=5)
+        q.put_many([1, 2, 3])
+
+        self.assertEqual(q.get_many(2), [1, 2])
+        self.assertEqual(q.get_many(10), [3])
+        self.assertTrue(q.empty())
+
     def test_invalid_maxsize_raises(self) -> None:
         with self.assertRaises(ValueError):
             BoundedBlockingQueue(0)
@@ -122,6 +151,71 @@ class TestProducerConsumerPipeline(unittest.TestCase):
             destination = run_pipeline(source, queue_maxsize=2)
             self.assertEqual(destination, source)
 
+    def test_run_pipeline_with_generator_source(self) -> None:
+        destination = run_pipeline((i * i for i in range(50)), queue_maxsize=2)
+        self.assertEqual(destination, [i * i for i in range(50)])
+
+    def test_producer_snapshot_ignores_later_mutation(self) -> None:
+        queue: BoundedBlockingQueue[int | object] = BoundedBlockingQueue(maxsize=2)
+        destination: List[int] = []
+        sentinel = object()
+        source = [1, 2, 3]
+
+        producer = Producer(source, queue, sentinel, snapshot=True)
+        consumer = Consumer(queue, destination, sentinel)
+        source.append(4)
+
+        producer.start()
+        consumer.start()
+        producer.join(timeout=3)
+        consumer.join(timeout=3)
+
+        self.assertEqual(destination, [1, 2, 3])
+
+    def test_run_pipeline_batches_preserve_order(self) -> None:
+        source = list(range(1000))
+        for batch_size in (1, 7, 128, 5000):
+            destination = run_pipeline(source, queue_maxsize=2, batch_size=batch_size)
+            self.assertEqual(destination, source)
+
+    def test_consumer_stores_items_unchanged(self) -> None:
+        queue: BoundedBlockingQueue[str | object] = BoundedBlockingQueue(maxsize=2)
+        destination: List[str] = []
+        sentinel = object()
+
+        consumer = Consumer(queue, destination, sentinel)
+        consumer.start()
+        queue.put("alpha")
+        queue.put(sentinel)
+        consumer.join(timeout=3)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(destination, ["alpha"])
+
+    def test_queue_maxsize_bounds_items_not_chunks(self) -> None:
+        queue: BoundedBlockingQueue[int | object] = BoundedBlockingQueue(maxsize=3)
+        sentinel = object()
+        producer = Producer(range(100), queue, sentinel, batch_size=50)
+        producer.start()
+
+        time.sleep(0.1)
+        self.assertTrue(producer.is_alive())
+        self.assertEqual(queue.size(), 3)
+
+        destination: List[int] = []
+        consumer = Consumer(queue, destination, sentinel)
+        consumer.start()
+        producer.join(timeout=3)
+        consumer.join(timeout=3)
+        self.assertEqual(destination, list(range(100)))
+
+    def test_producer_invalid_batch_size_raises(self) -> None:
+        queue: BoundedBlockingQueue[int | object] = BoundedBlockingQueue(maxsize=2)
+        with self.assertRaises(ValueError):
+            Producer([1, 2, 3], queue, object(), batch_size=0)
+        with self.assertRaises(ValueError):
+            Consumer(queue, [], object(), batch_size=0)
+
     def test_run_pipeline_invalid_maxsize(self) -> None:
         """
         run_pipeline should surface the same ValueError as BoundedBlockingQueue